@@ -1,35 +1,36 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import cloudscraper
+from __future__ import annotations
+
 import time
-import traceback
 import pymysql
-import pandas as pd
 import datetime
 import argparse
 import logging
+import logging.handlers
+import queue
+import atexit
+import copy
+import signal
 import sys
-from typing import List, Dict, Optional, Union, Tuple
+import threading
+from typing import List, Dict, Optional, Union, Tuple, TYPE_CHECKING
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import random
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, parse_qs
 import re
+import json
+import sqlite3
+import hashlib
+import os
+import socket
+
+# Heavy dependencies (selenium, webdriver_manager, bs4, cloudscraper, pandas)
+# are imported inside the functions that use them to keep cold start fast.
+if TYPE_CHECKING:
+    import cloudscraper
+    from bs4 import BeautifulSoup
+    from selenium import webdriver
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('forebet_scraper.log')
-    ]
-)
 logger = logging.getLogger('forebet_scraper')
 
 # Base configuration
@@ -39,6 +40,54 @@ REQUEST_DELAY = 5  # seconds between requests
 MIN_DELAY = 3  # minimum delay
 MAX_DELAY = 7  # maximum delay
 
+# Adaptive concurrency configuration for match detail fetches
+ADAPTIVE_MIN_WORKERS = 1
+ADAPTIVE_MAX_WORKERS = 10
+ADAPTIVE_INITIAL_WORKERS = 5
+ADAPTIVE_MIN_GAP = 0.2  # seconds between detail requests (all workers)
+ADAPTIVE_MAX_GAP = 15.0
+ADAPTIVE_INITIAL_GAP = 1.0
+ADAPTIVE_LATENCY_TARGET = 4.0  # seconds; slower responses count as congestion
+THROTTLE_STATUSES = (429, 503)
+
+# Logging configuration
+LOG_FILE = "forebet_scraper.log"
+# RotatingFileHandler cannot be shared between processes, so each worker gets its own file
+WORKER_LOG_FILE = "forebet_worker-{worker_id}.log"
+LOG_MAX_BYTES = 10 * 1024 * 1024  # rotate the log file at 10 MB
+LOG_BACKUP_COUNT = 5
+ERROR_LOG_RATE = 5  # warnings/errors allowed per call site per window
+ERROR_LOG_WINDOW = 60  # seconds
+
+# Checkpoint configuration
+CHECKPOINT_FILE = "forebet_checkpoint.db"
+
+# Prediction history configuration
+HISTORY_FILE = "forebet_history.db"
+# Fields tracked by the history store; the position is the stored field id,
+# so new fields must only ever be appended
+HISTORY_FIELDS = (
+    "prediction", "prob_1", "prob_x", "prob_2", "live_odds",
+    "score", "half_time_score"
+)
+
+# Daemon configuration
+DAEMON_INTERVAL = 30  # minutes between scrape cycles
+
+# Coordinator/worker job queue configuration
+QUEUE_FILE = "forebet_jobs.db"
+LEASE_TIMEOUT = 120  # seconds before an unacknowledged detail job is re-leased
+LISTING_LEASE_TIMEOUT = 900  # listing pages need Selenium and take longer
+MAX_JOB_ATTEMPTS = 5
+MAX_WRITE_ATTEMPTS = 3  # MySQL writes of one result before it is marked failed
+WRITER_BATCH_SIZE = 50  # results per save_to_mysql call in the coordinator
+QUEUE_POLL_INTERVAL = 2  # seconds
+QUEUE_STATUS_INTERVAL = 60  # seconds between "waiting for workers" messages
+
+# Read API configuration
+READ_API_HOST = "127.0.0.1"
+READ_API_PORT = 8080
+
 # MySQL configuration
 MYSQL_CONFIG = {
     "host": "db-9e954167-46f4-4bab-90a3-b65ba795ae3e.us-east-2.public.db.laravel.cloud",
@@ -50,6 +99,118 @@ MYSQL_CONFIG = {
     "cursorclass": pymysql.cursors.DictCursor
 }
 
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drop repeated warnings/errors from the same call site.
+
+    At most `rate` records per call site are let through per `per` seconds;
+    the next record after the window closes reports how many were dropped.
+    """
+
+    def __init__(self, rate: int = ERROR_LOG_RATE, per: float = ERROR_LOG_WINDOW,
+                 level: int = logging.WARNING):
+        super().__init__()
+        self.rate = rate
+        self.per = per
+        self.level = level
+        self.lock = threading.Lock()
+        self.windows = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.level:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self.lock:
+            start, count, suppressed = self.windows.get(key, (now, 0, 0))
+            if now - start >= self.per:
+                if suppressed:
+                    record.msg = f"{record.getMessage()} ({suppressed} similar messages suppressed)"
+                    record.args = ()
+                start, count, suppressed = now, 0, 0
+            if count < self.rate:
+                self.windows[key] = (start, count + 1, suppressed)
+                return True
+            self.windows[key] = (start, count, suppressed + 1)
+            return False
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback separate from the message."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() folds the traceback into msg, which would
+        # leave nothing for the JSON formatter's "exc" field
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+_log_listener = None
+
+def setup_logging(level: int = logging.INFO, log_file: str = LOG_FILE):
+    """
+    Route scraper logging through a queue so worker threads never block on I/O.
+
+    Records are put on an in-memory queue by a QueueHandler; a QueueListener
+    thread writes them to stdout (plain text) and to a size-rotated JSON log.
+    The handler sits on the root logger so warnings from selenium, urllib3
+    and cloudscraper end up in the same log.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    # Third-party loggers stay at INFO or above even when the scraper logs DEBUG
+    root_logger = logging.getLogger()
+    root_logger.setLevel(max(level, logging.INFO))
+    root_logger.addHandler(queue_handler)
+    logger.setLevel(level)
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 def get_dates_range(days_ahead: int = 3) -> List[str]:
     """
     Generate a list of dates from today to X days ahead in YYYY-MM-DD format.
@@ -88,26 +249,49 @@ def get_dynamic_url(date: Optional[str] = None) -> str:
     # Construct URL with date
     return f"{BASE_URL}/en/football-predictions/predictions-1x2/{date}"
 
+# Shared MySQL connection, kept open between batches (and daemon cycles)
+_db_connection = None
+
+def get_db_connection() -> pymysql.connections.Connection:
+    """Return the shared MySQL connection, reconnecting if it has gone away."""
+    global _db_connection
+    if _db_connection is None:
+        _db_connection = pymysql.connect(**MYSQL_CONFIG)
+    else:
+        _db_connection.ping(reconnect=True)
+    return _db_connection
+
+def close_db_connection():
+    """Close the shared MySQL connection if one is open."""
+    global _db_connection
+    if _db_connection is not None:
+        try:
+            _db_connection.close()
+        except Exception:
+            pass
+        _db_connection = None
+
 def test_mysql_connection() -> bool:
     """Test the MySQL connection."""
     logger.info("Testing database connection...")
     try:
-        conn = pymysql.connect(**MYSQL_CONFIG)
-        conn.ping(reconnect=True)
-        conn.close()
+        get_db_connection()
         logger.info("Database connection successful!")
         return True
     except pymysql.MySQLError as err:
-        logger.error(f"MySQL Error: {err}")
-        traceback.print_exc()
+        logger.error(f"MySQL Error: {err}", exc_info=True)
         return False
     except Exception as e:
-        logger.error(f"Unexpected Error: {e}")
-        traceback.print_exc()
+        logger.error(f"Unexpected Error: {e}", exc_info=True)
         return False
 
 def setup_driver() -> webdriver.Chrome:
     """Configure and start the Chrome WebDriver."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     logger.info("Setting up Chrome WebDriver...")
     options = Options()
     options.add_argument("--no-sandbox")
@@ -150,8 +334,122 @@ def random_delay():
     time.sleep(delay)
     return delay
 
+class AdaptiveController:
+    """
+    AIMD controller for in-flight detail fetches and the gap between them.
+
+    Each round of successful, fast responses adds one worker and shrinks the
+    inter-request gap by 20%.
+    Throttling (429/503), errors and responses slower than the latency target
+    halve the limit and double the gap. Only one decrease is applied per
+    round: responses to requests sent before the last decrease are ignored.
+    """
+
+    def __init__(self, min_workers: int = ADAPTIVE_MIN_WORKERS, max_workers: int = ADAPTIVE_MAX_WORKERS,
+                 initial_workers: int = ADAPTIVE_INITIAL_WORKERS, min_gap: float = ADAPTIVE_MIN_GAP,
+                 max_gap: float = ADAPTIVE_MAX_GAP, initial_gap: float = ADAPTIVE_INITIAL_GAP,
+                 latency_target: float = ADAPTIVE_LATENCY_TARGET):
+        if min_workers < 1 or min_workers > max_workers:
+            raise ValueError(f"Invalid worker bounds: min {min_workers}, max {max_workers}")
+        if min_gap < 0 or min_gap > max_gap:
+            raise ValueError(f"Invalid gap bounds: min {min_gap}, max {max_gap}")
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.latency_target = latency_target
+        self.limit = float(min(max(initial_workers, min_workers), max_workers))
+        self.gap = min(max(initial_gap, min_gap), max_gap)
+        self.in_flight = 0
+        self.healthy = 0
+        self.next_slot = 0.0
+        self.last_decrease = 0.0
+        self.avg_latency = 0.0
+        self.error_rate = 0.0
+        self.cond = threading.Condition()
+
+    @property
+    def workers(self) -> int:
+        """Current number of allowed in-flight requests."""
+        return int(self.limit)
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent, honouring the limit and the gap.
+
+        Returns:
+            Monotonic send time, to be passed back to release()
+        """
+        with self.cond:
+            while self.in_flight >= self.workers:
+                self.cond.wait()
+            self.in_flight += 1
+            now = time.monotonic()
+            start = max(now, self.next_slot)
+            # Jitter the spacing so requests do not look machine-timed
+            self.next_slot = start + self.gap * random.uniform(0.5, 1.5)
+
+        if start > now:
+            time.sleep(start - now)
+        return start
+
+    def release(self, started: float, status: Optional[int] = None, error: bool = False):
+        """
+        Report the outcome of a request sent at `started` and adjust the limits.
+
+        Args:
+            started: Value returned by acquire()
+            status: HTTP status code, if a response was received
+            error: True if the request raised instead of returning a response
+        """
+        latency = time.monotonic() - started
+        throttled = status in THROTTLE_STATUSES
+        failed = error or throttled or (status is not None and status >= 500)
+
+        with self.cond:
+            self.in_flight -= 1
+            self.avg_latency = 0.8 * self.avg_latency + 0.2 * latency
+            self.error_rate = 0.8 * self.error_rate + 0.2 * (1.0 if failed else 0.0)
+
+            old_workers, old_gap = self.workers, self.gap
+            if failed or latency > self.latency_target:
+                if started >= self.last_decrease:
+                    self.limit = max(float(self.min_workers), self.limit / 2)
+                    self.gap = min(self.max_gap, self.gap * 2)
+                    self.last_decrease = time.monotonic()
+                    self.healthy = 0
+                    if throttled:
+                        reason = f"HTTP {status}"
+                    elif failed:
+                        reason = f"error (status {status})" if status else "request error"
+                    else:
+                        reason = f"latency {latency:.1f}s > {self.latency_target:.1f}s"
+                    self._log_adjustment(old_workers, old_gap, reason)
+            elif started >= self.last_decrease:
+                # Additive increase once per round of `workers` healthy responses
+                self.healthy += 1
+                if self.healthy >= self.workers:
+                    self.healthy = 0
+                    self.limit = min(float(self.max_workers), self.limit + 1)
+                    self.gap = max(self.min_gap, self.gap * 0.8)
+                    self._log_adjustment(old_workers, old_gap, "healthy responses")
+            self.cond.notify_all()
+
+    def _log_adjustment(self, old_workers: int, old_gap: float, reason: str):
+        if self.workers == old_workers and self.gap == old_gap:
+            return
+        logger.info(
+            f"Adaptive concurrency: workers {old_workers} -> {self.workers}, "
+            f"gap {old_gap:.2f}s -> {self.gap:.2f}s ({reason}; "
+            f"avg latency {self.avg_latency:.2f}s, error rate {self.error_rate:.0%})"
+        )
+
 def load_full_page(driver: webdriver.Chrome, url: str) -> str:
     """Load the full page content by clicking 'More' buttons."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
     logger.info(f"Loading page: {url}")
     try:
         driver.get(url)
@@ -293,20 +591,37 @@ def extract_standing_details(soup: BeautifulSoup, team_name: str) -> Dict[str, s
     logger.warning(f"No standings found for {team_name}")
     return stats_fields
 
-def fetch_match_details(game_url: str, home_team: str, away_team: str, scraper: cloudscraper.CloudScraper) -> Dict[str, str]:
-    """Fetch detailed match information from the match page."""
-    logger.info(f"Fetching details for {home_team} vs {away_team}")
+def fetch_match_details(game_url: str, home_team: str, away_team: str, scraper: cloudscraper.CloudScraper,
+                        controller: Optional[AdaptiveController] = None) -> Dict[str, str]:
+    """
+    Fetch detailed match information from the match page.
+
+    With a controller, request pacing and concurrency come from the
+    controller instead of a fixed random delay.
+    """
+    from bs4 import BeautifulSoup
+
+    logger.debug(f"Fetching details for {home_team} vs {away_team}")
     
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            # Random delay between requests
-            delay = random_delay()
-            
             # Add unique query param to avoid cache
             cache_buster = f"?_cb={int(time.time())}"
             full_url = f"{game_url}{cache_buster}"
-            
-            response = scraper.get(full_url)
+
+            if controller:
+                started = controller.acquire()
+                try:
+                    response = scraper.get(full_url)
+                except Exception:
+                    controller.release(started, error=True)
+                    raise
+                controller.release(started, response.status_code)
+            else:
+                # Random delay between requests
+                random_delay()
+                response = scraper.get(full_url)
+
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, "html.parser")
 
@@ -340,7 +655,7 @@ def fetch_match_details(game_url: str, home_team: str, away_team: str, scraper:
                 # Add away team stats with prefix
                 result.update({f"away_{k.lower()}": v for k, v in away_stats.items()})
 
-                logger.info(f"Successfully fetched details for {home_team} vs {away_team}")
+                logger.debug(f"Successfully fetched details for {home_team} vs {away_team}")
                 return result
             else:
                 logger.warning(f"HTTP {response.status_code} for {game_url}, attempt {attempt}/{MAX_RETRIES}")
@@ -348,8 +663,9 @@ def fetch_match_details(game_url: str, home_team: str, away_team: str, scraper:
         except Exception as e:
             logger.warning(f"Attempt {attempt}/{MAX_RETRIES} failed for {home_team} vs {away_team}: {e}")
             
-        # Increase delay on failures
-        time.sleep(attempt * 2)
+        # Increase delay on failures (the controller already backs off on its own)
+        if not controller:
+            time.sleep(attempt * 2)
 
     logger.error(f"Failed to fetch details for {home_team} vs {away_team} after {MAX_RETRIES} attempts")
     return {
@@ -360,8 +676,896 @@ def fetch_match_details(game_url: str, home_team: str, away_team: str, scraper:
         "away_gf": "", "away_ga": "", "away_gd": ""
     }
 
-def parse_page(html: str, scraper: cloudscraper.CloudScraper, current_date: str) -> List[Dict[str, str]]:
+class CheckpointJournal:
+    """
+    SQLite-backed journal of completed work, used to resume interrupted runs.
+
+    Writes are buffered in memory and only committed (and fsynced) once per
+    batch, so journaling adds one disk flush per batch rather than per match.
+    """
+
+    def __init__(self, path: str = CHECKPOINT_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS completed_dates (
+            date TEXT PRIMARY KEY,
+            match_count INTEGER NOT NULL,
+            completed_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS completed_batches (
+            date TEXT NOT NULL,
+            batch_start INTEGER NOT NULL,
+            batch_end INTEGER NOT NULL,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (date, batch_start)
+        );
+        CREATE TABLE IF NOT EXISTS match_results (
+            date TEXT NOT NULL,
+            match_url TEXT NOT NULL,
+            record TEXT NOT NULL,
+            saved INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (date, match_url)
+        );
+        """)
+        self.conn.commit()
+        self._pending_results = []
+        self._pending_saved = []
+        self._pending_batches = []
+
+    def reset(self):
+        """Discard all journaled work so the next run starts from zero."""
+        self._pending_results.clear()
+        self._pending_saved.clear()
+        self._pending_batches.clear()
+        self.conn.execute("DELETE FROM completed_dates")
+        self.conn.execute("DELETE FROM completed_batches")
+        self.conn.execute("DELETE FROM match_results")
+        self.conn.commit()
+
+    def completed_dates(self) -> List[str]:
+        """Return the dates that were fully processed by a previous run."""
+        rows = self.conn.execute("SELECT date FROM completed_dates ORDER BY date")
+        return [row[0] for row in rows]
+
+    def completed_results(self, date: str) -> Dict[str, Dict[str, str]]:
+        """Return journaled match records for a date, keyed by match URL."""
+        rows = self.conn.execute(
+            "SELECT match_url, record FROM match_results WHERE date = ?", (date,)
+        )
+        return {url: json.loads(record) for url, record in rows}
+
+    def unsaved_results(self) -> List[Dict[str, str]]:
+        """Return journaled match records that never made it into MySQL."""
+        rows = self.conn.execute("SELECT record FROM match_results WHERE saved = 0")
+        return [json.loads(row[0]) for row in rows]
+
+    def record_results(self, date: str, records: List[Dict[str, str]]):
+        """Buffer fetched match records until the next flush."""
+        for record in records:
+            self._pending_results.append(
+                (date, record.get("match_url", ""), json.dumps(record))
+            )
+
+    def mark_saved(self, date: Optional[str], records: List[Dict[str, str]]):
+        """Buffer the fact that these records were written to MySQL."""
+        for record in records:
+            self._pending_saved.append((date, record.get("match_url", "")))
+
+    def mark_batch(self, date: str, batch_start: int, batch_end: int):
+        """Buffer a completed batch marker."""
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending_batches.append((date, batch_start, batch_end, now))
+
+    def mark_date(self, date: str, match_count: int):
+        """Record a fully processed date and flush everything buffered so far."""
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO completed_dates (date, match_count, completed_at) VALUES (?, ?, ?)",
+            (date, match_count, now)
+        )
+        self.flush()
+
+    def flush(self):
+        """Write buffered entries in a single transaction (one fsync)."""
+        if self._pending_results:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO match_results (date, match_url, record, saved) VALUES (?, ?, ?, 0)",
+                self._pending_results
+            )
+        if self._pending_saved:
+            for date, match_url in self._pending_saved:
+                if date is None:
+                    self.conn.execute(
+                        "UPDATE match_results SET saved = 1 WHERE match_url = ?", (match_url,)
+                    )
+                else:
+                    self.conn.execute(
+                        "UPDATE match_results SET saved = 1 WHERE date = ? AND match_url = ?",
+                        (date, match_url)
+                    )
+        if self._pending_batches:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO completed_batches (date, batch_start, batch_end, completed_at) VALUES (?, ?, ?, ?)",
+                self._pending_batches
+            )
+        self.conn.commit()
+        self._pending_results.clear()
+        self._pending_saved.clear()
+        self._pending_batches.clear()
+
+    def compact(self):
+        """
+        Compact the journal after a finished run.
+
+        Saved match records and batch markers are no longer needed once the
+        run is complete, so they are dropped and the file is vacuumed. Any
+        records that still failed to save are kept for the next --resume.
+        """
+        self.flush()
+        self.conn.execute("DELETE FROM match_results WHERE saved = 1")
+        self.conn.execute("DELETE FROM completed_batches")
+        self.conn.execute("DELETE FROM completed_dates")
+        self.conn.commit()
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.execute("VACUUM")
+        logger.info(f"Checkpoint journal compacted: {self.path}")
+
+    def close(self):
+        """Flush pending entries and close the journal."""
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
+
+def replay_unsaved_results(journal: CheckpointJournal,
+                           history: Optional[PredictionHistory] = None) -> int:
+    """
+    Save journaled results that were fetched but never written to MySQL.
+
+    Args:
+        journal: Checkpoint journal from an interrupted run
+        history: Optional prediction history store to record replayed results in
+
+    Returns:
+        Number of records replayed
+    """
+    unsaved = journal.unsaved_results()
+    if not unsaved:
+        return 0
+
+    logger.info(f"Replaying {len(unsaved)} unsaved results from checkpoint journal")
+    if save_records(unsaved):
+        journal.mark_saved(None, unsaved)
+        journal.flush()
+    if history:
+        history.record(unsaved)
+    return len(unsaved)
+
+class PredictionHistory:
+    """
+    Append-only SQLite store of how predictions and odds change over time.
+
+    Only fields whose value differs from the last observation are written,
+    one narrow (match, field, time, value) row each. Match URLs and field
+    names are interned to small integers to keep rows compact.
+    """
+
+    def __init__(self, path: str = HISTORY_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS history_matches (
+            id INTEGER PRIMARY KEY,
+            match_url TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS history_changes (
+            match_id INTEGER NOT NULL,
+            field INTEGER NOT NULL,
+            observed_at INTEGER NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (match_id, field, observed_at)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_history_changes_field_time
+            ON history_changes (field, observed_at);
+        CREATE TABLE IF NOT EXISTS history_latest (
+            match_id INTEGER NOT NULL,
+            field INTEGER NOT NULL,
+            observed_at INTEGER NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (match_id, field)
+        ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+        self._match_ids = {}
+
+    def _match_id(self, match_url: str) -> int:
+        """Return the interned id for a match URL, creating it if needed."""
+        match_id = self._match_ids.get(match_url)
+        if match_id is None:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO history_matches (match_url) VALUES (?)", (match_url,)
+            )
+            match_id = self.conn.execute(
+                "SELECT id FROM history_matches WHERE match_url = ?", (match_url,)
+            ).fetchone()[0]
+            self._match_ids[match_url] = match_id
+        return match_id
+
+    def record(self, records: List[Dict[str, str]]) -> int:
+        """
+        Record changed tracked fields for a batch of match records.
+
+        Args:
+            records: Match data dictionaries as saved to MySQL
+
+        Returns:
+            Number of change rows written
+        """
+        changes = []
+        # Latest values queued by this call, so a match that appears twice
+        # in one batch is compared against its own earlier entry
+        queued = {}
+        for record in records:
+            match_url = record.get("match_url")
+            if not match_url:
+                continue
+            try:
+                observed_at = int(datetime.datetime.strptime(
+                    record.get("timestamp", ""), "%Y-%m-%d %H:%M:%S").timestamp())
+            except ValueError:
+                observed_at = int(time.time())
+
+            match_id = self._match_id(match_url)
+            latest = queued.get(match_id)
+            if latest is None:
+                latest = {
+                    field: (ts, value) for field, ts, value in self.conn.execute(
+                        "SELECT field, observed_at, value FROM history_latest WHERE match_id = ?",
+                        (match_id,)
+                    )
+                }
+                queued[match_id] = latest
+            for field_id, field in enumerate(HISTORY_FIELDS):
+                value = record.get(field, "") or ""
+                previous = latest.get(field_id)
+                # Skip unchanged values and observations older than the latest one
+                if previous and (previous[0] >= observed_at or previous[1] == value):
+                    continue
+                changes.append((match_id, field_id, observed_at, value))
+                latest[field_id] = (observed_at, value)
+
+        if changes:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO history_changes (match_id, field, observed_at, value) VALUES (?, ?, ?, ?)",
+                changes
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO history_latest (match_id, field, observed_at, value) VALUES (?, ?, ?, ?)",
+                changes
+            )
+        self.conn.commit()
+        return len(changes)
+
+    def probability_trajectory(self, match_url: str) -> List[Dict[str, str]]:
+        """
+        Return the prediction and probability trajectory of one match.
+
+        Each entry is a full snapshot (prediction, prob_1, prob_x, prob_2)
+        at a point where at least one of them changed.
+        """
+        fields = ("prediction", "prob_1", "prob_x", "prob_2")
+        field_ids = [HISTORY_FIELDS.index(f) for f in fields]
+        rows = self.conn.execute(
+            f"""
+            SELECT c.observed_at, c.field, c.value
+            FROM history_matches m
+            JOIN history_changes c ON c.match_id = m.id
+            WHERE m.match_url = ? AND c.field IN ({",".join("?" * len(field_ids))})
+            ORDER BY c.observed_at
+            """,
+            (match_url, *field_ids)
+        )
+
+        trajectory = []
+        current = dict.fromkeys(fields, "")
+        for observed_at, field_id, value in rows:
+            current[HISTORY_FIELDS[field_id]] = value
+            point = {"observed_at": datetime.datetime.fromtimestamp(observed_at).strftime("%Y-%m-%d %H:%M:%S")}
+            point.update(current)
+            if trajectory and trajectory[-1]["observed_at"] == point["observed_at"]:
+                trajectory[-1] = point
+            else:
+                trajectory.append(point)
+        return trajectory
+
+    def prediction_flips(self, hours: float) -> List[Dict[str, str]]:
+        """Return matches whose prediction changed within the last N hours."""
+        field_id = HISTORY_FIELDS.index("prediction")
+        since = int(time.time() - hours * 3600)
+        rows = self.conn.execute(
+            """
+            SELECT m.match_url, c.observed_at, c.value,
+                (SELECT p.value FROM history_changes p
+                 WHERE p.match_id = c.match_id AND p.field = c.field
+                   AND p.observed_at < c.observed_at
+                 ORDER BY p.observed_at DESC LIMIT 1) AS previous
+            FROM history_changes c
+            JOIN history_matches m ON m.id = c.match_id
+            WHERE c.field = ? AND c.observed_at >= ?
+            ORDER BY c.observed_at DESC
+            """,
+            (field_id, since)
+        )
+        return [
+            {
+                "match_url": match_url,
+                "observed_at": datetime.datetime.fromtimestamp(observed_at).strftime("%Y-%m-%d %H:%M:%S"),
+                "previous": previous,
+                "prediction": value
+            }
+            for match_url, observed_at, value, previous in rows
+            if previous is not None and previous != value
+        ]
+
+    def close(self):
+        """Close the history store."""
+        self.conn.close()
+
+class MatchIndex:
+    """
+    Thread-safe in-memory store of the latest scraped matches.
+
+    Records are keyed by match URL with secondary indexes by scrape date,
+    league and team so the read API can filter without scanning everything.
+    ETags are a hash of each filtered response, so an update only changes the
+    ETag of filters whose matches changed; the global version is on /health.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = {}
+        self.record_dates = {}
+        self.by_date = {}
+        self.by_league = {}
+        self.by_team = {}
+        self.version = 0
+        self.updated_at = ""
+        self._response_cache = {}
+
+    @staticmethod
+    def _add(index: Dict[str, set], key: str, match_url: str):
+        if key:
+            index.setdefault(key, set()).add(match_url)
+
+    @staticmethod
+    def _discard(index: Dict[str, set], key: str, match_url: str):
+        urls = index.get(key)
+        if urls is not None:
+            urls.discard(match_url)
+            if not urls:
+                del index[key]
+
+    def _unindex(self, match_url: str):
+        record = self.records.pop(match_url)
+        date = self.record_dates.pop(match_url)
+        self._discard(self.by_date, date, match_url)
+        self._discard(self.by_league, record.get("league", "").lower(), match_url)
+        self._discard(self.by_team, record.get("home_team", "").lower(), match_url)
+        self._discard(self.by_team, record.get("away_team", "").lower(), match_url)
+
+    def update(self, date: str, records: List[Dict[str, str]]):
+        """Insert or replace match records scraped for a date."""
+        with self.lock:
+            for record in records:
+                match_url = record.get("match_url")
+                if not match_url:
+                    continue
+                if match_url in self.records:
+                    self._unindex(match_url)
+                self.records[match_url] = dict(record)
+                self.record_dates[match_url] = date
+                self._add(self.by_date, date, match_url)
+                self._add(self.by_league, record.get("league", "").lower(), match_url)
+                self._add(self.by_team, record.get("home_team", "").lower(), match_url)
+                self._add(self.by_team, record.get("away_team", "").lower(), match_url)
+            self._bump()
+
+    def retain_dates(self, dates: List[str]):
+        """Drop matches whose scrape date is no longer in the given range."""
+        with self.lock:
+            stale = [url for url, date in self.record_dates.items() if date not in dates]
+            for match_url in stale:
+                self._unindex(match_url)
+            if stale:
+                self._bump()
+
+    def _bump(self):
+        self.version += 1
+        self.updated_at = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._response_cache.clear()
+
+    def query(self, date: str = "", league: str = "", team: str = "") -> Tuple[bytes, str]:
+        """
+        Return the JSON body and ETag for matches matching all given filters.
+
+        Responses are cached per filter until the next update.
+        """
+        cache_key = (date, league.lower(), team.lower())
+        with self.lock:
+            cached = self._response_cache.get(cache_key)
+            if cached:
+                return cached
+
+            candidates = None
+            for index, key in ((self.by_date, date), (self.by_league, league.lower()),
+                               (self.by_team, team.lower())):
+                if not key:
+                    continue
+                urls = index.get(key, set())
+                candidates = set(urls) if candidates is None else candidates & urls
+            if candidates is None:
+                candidates = self.records.keys()
+
+            matches = [self.records[url] for url in sorted(candidates)]
+            body = json.dumps({"count": len(matches), "matches": matches}).encode("utf-8")
+            etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            self._response_cache[cache_key] = (body, etag)
+            return body, etag
+
+class ReadAPIHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving the match index as JSON, with ETag support."""
+
+    protocol_version = "HTTP/1.1"
+    # Buffer writes so headers and body leave in one segment; separate small
+    # writes stall on Nagle/delayed-ACK with keep-alive clients
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    index: MatchIndex = None
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/health":
+            body = json.dumps({
+                "status": "ok",
+                "version": self.index.version,
+                "matches": len(self.index.records),
+                "updated_at": self.index.updated_at
+            }).encode("utf-8")
+            self._send(200, body)
+            return
+
+        if parsed.path != "/matches":
+            self._send(404, json.dumps({"error": "not found"}).encode("utf-8"))
+            return
+
+        params = parse_qs(parsed.query)
+        body, etag = self.index.query(
+            date=params.get("date", [""])[0],
+            league=params.get("league", [""])[0],
+            team=params.get("team", [""])[0]
+        )
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", etag)
+        else:
+            self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: str = ""):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Request logging would flood the scraper log
+        pass
+
+def start_read_api(index: MatchIndex, host: str = READ_API_HOST, port: int = READ_API_PORT) -> ThreadingHTTPServer:
+    """
+    Start the read API in a background thread.
+
+    Args:
+        index: Match index to serve
+        host: Interface to bind to
+        port: Port to listen on
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    handler = type("BoundReadAPIHandler", (ReadAPIHandler,), {"index": index})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="read-api", daemon=True)
+    thread.start()
+    logger.info(f"Read API listening on http://{host}:{server.server_port}")
+    return server
+
+def wait_for_stop_signal():
+    """Block until SIGINT or SIGTERM, e.g. to keep the read API up after a coordinator run."""
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping the read API")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    while not stop_event.is_set():
+        stop_event.wait(1)
+
+class JobQueue:
+    """
+    Durable SQLite job queue shared by the coordinator and worker processes.
+
+    Jobs are leased with a visibility timeout: a job whose lease expires
+    without being completed (e.g. the worker died) becomes available to any
+    other worker again, up to MAX_JOB_ATTEMPTS leases.
+
+    The coordinator marks its run in queue_meta (run_state "running" or
+    "finished"), so workers started before it wait for the run instead of
+    exiting on state left over from the previous one.
+    """
+
+    def __init__(self, path: str = QUEUE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            date TEXT NOT NULL,
+            job_key TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires REAL,
+            result TEXT,
+            written INTEGER NOT NULL DEFAULT 0,
+            write_attempts INTEGER NOT NULL DEFAULT 0,
+            UNIQUE (kind, date, job_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs (kind, status, lease_expires);
+        CREATE INDEX IF NOT EXISTS idx_jobs_unwritten ON jobs (status, written);
+        CREATE TABLE IF NOT EXISTS queue_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+        """)
+        # Queue files created before write_attempts existed
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+        if "write_attempts" not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN write_attempts INTEGER NOT NULL DEFAULT 0")
+
+    def reset(self):
+        """Remove all jobs and coordinator state."""
+        with self.lock:
+            self.conn.execute("DELETE FROM jobs")
+            self.conn.execute("DELETE FROM queue_meta")
+
+    def set_meta(self, key: str, value: str):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO queue_meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def get_meta(self, key: str, default: str = "") -> str:
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM queue_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def start_run(self):
+        """
+        Mark a coordinator run as active; listings are not expanded yet.
+
+        The coordinator is the only listing consumer, so listing leases still
+        held at this point belong to a coordinator that died and are released.
+        """
+        with self.lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'pending', lease_owner = NULL, lease_expires = NULL "
+                "WHERE kind = 'listing' AND status = 'leased'"
+            )
+        self.set_meta("expansion_done", "0")
+        self.set_meta("run_state", "running")
+
+    def finish_run(self):
+        self.set_meta("run_state", "finished")
+
+    def run_active(self) -> bool:
+        return self.get_meta("run_state") == "running"
+
+    def enqueue_many(self, kind: str, date: str, items: List[Tuple[str, Dict]]) -> int:
+        """
+        Add jobs of one kind for a date; jobs that already exist are left alone.
+
+        Args:
+            kind: Job kind ("listing" or "detail")
+            date: Scrape date the jobs belong to
+            items: (job_key, payload) pairs
+
+        Returns:
+            Number of new jobs
+        """
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (kind, date, job_key, payload) VALUES (?, ?, ?, ?)",
+                [(kind, date, key, json.dumps(payload)) for key, payload in items]
+            )
+            self.conn.execute("COMMIT")
+            return self.conn.total_changes - before
+
+    def _reap_expired(self, kind: str, now: float) -> int:
+        # Jobs that keep losing their lease are given up on, the rest are retried
+        before = self.conn.total_changes
+        self.conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, lease_expires = NULL "
+            "WHERE kind = ? AND status = 'leased' AND lease_expires < ?",
+            (MAX_JOB_ATTEMPTS, kind, now)
+        )
+        return self.conn.total_changes - before
+
+    def reap_expired(self, kind: str) -> int:
+        """
+        Return jobs whose lease expired to pending, or fail them after MAX_JOB_ATTEMPTS.
+
+        Returns:
+            Number of jobs reaped
+        """
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                reaped = self._reap_expired(kind, time.time())
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return reaped
+
+    def lease(self, worker_id: str, kind: str, timeout: float) -> Optional[Dict]:
+        """
+        Lease the oldest available job of a kind, including jobs with expired leases.
+
+        Returns:
+            Dict with id, date, key, payload and attempts, or None if nothing is available
+        """
+        now = time.time()
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reap_expired(kind, now)
+                row = self.conn.execute(
+                    "SELECT id, date, job_key, payload, attempts FROM jobs "
+                    "WHERE kind = ? AND status = 'pending' ORDER BY id LIMIT 1",
+                    (kind,)
+                ).fetchone()
+                if row:
+                    self.conn.execute(
+                        "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                        "attempts = attempts + 1 WHERE id = ?",
+                        (worker_id, now + timeout, row[0])
+                    )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        if not row:
+            return None
+        return {
+            "id": row[0], "date": row[1], "key": row[2],
+            "payload": json.loads(row[3]), "attempts": row[4] + 1
+        }
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict] = None) -> bool:
+        """
+        Mark a leased job done. Returns False if the lease was lost to another worker.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, lease_expires = NULL "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (json.dumps(result) if result is not None else None, job_id, worker_id)
+            )
+            return cursor.rowcount > 0
+
+    def release(self, job_id: int, worker_id: str):
+        """Give a leased job back after a failure so it can be retried."""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, lease_expires = NULL "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (MAX_JOB_ATTEMPTS, job_id, worker_id)
+            )
+
+    def unwritten_results(self, limit: int) -> List[Dict]:
+        """Return completed detail jobs whose results are not yet in MySQL."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id, date, result FROM jobs "
+                "WHERE status = 'done' AND written = 0 AND kind = 'detail' "
+                "ORDER BY id LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [{"id": row[0], "date": row[1], "result": json.loads(row[2])} for row in rows]
+
+    def mark_written(self, job_ids: List[int]):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("UPDATE jobs SET written = 1 WHERE id = ?", [(i,) for i in job_ids])
+            self.conn.execute("COMMIT")
+
+    def mark_write_failed(self, job_ids: List[int]) -> int:
+        """
+        Count a failed MySQL write against each job; fail jobs after MAX_WRITE_ATTEMPTS.
+
+        Returns:
+            Number of jobs given up on
+        """
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "UPDATE jobs SET write_attempts = write_attempts + 1 WHERE id = ?", [(i,) for i in job_ids]
+            )
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "UPDATE jobs SET status = 'failed' WHERE id = ? AND write_attempts >= ?",
+                [(i, MAX_WRITE_ATTEMPTS) for i in job_ids]
+            )
+            failed = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+            return failed
+
+    def counts(self, kind: str) -> Dict[str, int]:
+        """Return the number of jobs of a kind per status."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) FROM jobs WHERE kind = ? GROUP BY status", (kind,)
+            )
+            return {status: count for status, count in rows}
+
+    def drained(self) -> bool:
+        """True once the coordinator has queued everything and no listing or detail job is outstanding."""
+        if self.get_meta("expansion_done") != "1":
+            return False
+        for kind in ("listing", "detail"):
+            counts = self.counts(kind)
+            if counts.get("pending", 0) or counts.get("leased", 0):
+                return False
+        return True
+
+    def close(self):
+        self.conn.close()
+
+def parse_listing_row(match: BeautifulSoup, i: int) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Extract the basic match data from one listing row.
+
+    Args:
+        match: The row's div.rcnt element
+        i: Zero-based row position, used in log messages
+
+    Returns:
+        Dict with the base record plus url/home/away, or None if the row is incomplete
+    """
+    # Extract all required elements
+    meta = match.find("meta", {"itemprop": "name"})
+    prediction_span = match.find("span", class_="forepr")
+    probs = match.find("div", class_="fprc")
+    link_tag = match.find("a", class_="tnmscn")
+    time_tag = match.find("span", class_="date_bah")
+    time_element = match.find("time", {"itemprop": "startDate"})
+    score_full = match.find("b", class_="l_scr")
+    score_half = match.find("span", class_="ht_scr")
+    et_min = match.find("div", class_="ladtm")
+    et_minute = match.find("span", class_="l_min")
+    live_odds_tag = match.find("span", class_="lscrsp")
+
+    # Skip if essential elements are missing
+    if not all([meta, prediction_span, probs, link_tag]):
+        logger.warning(f"Match #{i+1} skipped: Missing essential elements")
+        return None
+
+    # Extract all data
+    game_name = meta.get("content", "").strip()
+    prediction = prediction_span.get_text(strip=True)
+    match_time = time_tag.text.strip() if time_tag else ""
+    match_datetime = time_element.get("datetime", "") if time_element else ""
+    match_score = score_full.text.strip() if score_full else ""
+    half_time_score = score_half.text.strip() if score_half else ""
+    extra_time = et_min.text.strip() if et_min else ""
+    extra_minute = et_minute.text.strip() if et_minute else ""
+    live_odds = live_odds_tag.text.strip() if live_odds_tag else ""
+
+    # Extract probabilities
+    prob_spans = probs.find_all("span")
+    if len(prob_spans) != 3:
+        logger.warning(f"Match #{i+1} skipped: Incorrect probability format")
+        return None
+
+    prob_1, prob_x, prob_2 = [p.text.strip() for p in prob_spans]
+
+    # Extract teams and URL
+    home_team = link_tag.find("span", class_="homeTeam").text.strip()
+    away_team = link_tag.find("span", class_="awayTeam").text.strip()
+    raw_href = link_tag.get('href', '')
+    game_url = fix_forebet_url(raw_href)
+
+    # Try to extract league name
+    league_tag = match.find_previous("center", class_="leagpredlnk")
+    league_name = ""
+    if league_tag:
+        league_link = league_tag.find("a", class_="leagpred_btn")
+        if league_link:
+            league_name = league_link.get_text(strip=True)
+
+    # Store all basic data
+    match_data = {
+        "base": {
+            "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "game": game_name,
+            "time_str": match_time,
+            "iso_time": match_datetime,
+            "score": match_score,
+            "half_time_score": half_time_score,
+            "et": extra_time,
+            "et_minute": extra_minute,
+            "prediction": prediction,
+            "prob_1": prob_1,
+            "prob_x": prob_x,
+            "prob_2": prob_2,
+            "home_team": home_team,
+            "away_team": away_team,
+            "match_url": game_url,
+            "league": league_name,
+            "live_odds": live_odds
+        },
+        "url": game_url,
+        "home": home_team,
+        "away": away_team
+    }
+    return match_data
+
+def parse_listing(html: str) -> List[Dict[str, Dict[str, str]]]:
+    """Parse all listing rows of a page without fetching match details."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for i, match in enumerate(soup.find_all("div", class_="rcnt")):
+        try:
+            match_data = parse_listing_row(match, i)
+        except Exception as e:
+            logger.error(f"Error processing match #{i+1}: {str(e)}")
+            logger.debug(f"Traceback for match #{i+1}", exc_info=True)
+            continue
+        if match_data:
+            rows.append(match_data)
+    return rows
+
+def parse_page(html: str, scraper: cloudscraper.CloudScraper, current_date: str,
+               journal: Optional[CheckpointJournal] = None,
+               history: Optional[PredictionHistory] = None,
+               index: Optional[MatchIndex] = None,
+               controller: Optional[AdaptiveController] = None) -> List[Dict[str, str]]:
     """Parse the page HTML to extract match information."""
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
     matches = soup.find_all("div", class_="rcnt")
     total = len(matches)
@@ -373,6 +1577,16 @@ def parse_page(html: str, scraper: cloudscraper.CloudScraper, current_date: str)
 
     predictions = []
     batch_size = 10  # Process matches in smaller batches
+    if controller:
+        # Batches must be at least as large as the ceiling or it is never reached
+        batch_size = max(batch_size, controller.max_workers)
+
+    # Matches already fetched by an interrupted run are taken from the journal
+    journaled = journal.completed_results(current_date) if journal else {}
+    if journaled:
+        logger.info(f"Resuming {current_date}: {len(journaled)} matches already in checkpoint journal")
+        if index:
+            index.update(current_date, list(journaled.values()))
     
     for batch_start in range(0, total, batch_size):
         batch_end = min(batch_start + batch_size, total)
@@ -384,128 +1598,78 @@ def parse_page(html: str, scraper: cloudscraper.CloudScraper, current_date: str)
         for i in range(batch_start, batch_end):
             match = matches[i]
             try:
-                # Extract all required elements
-                meta = match.find("meta", {"itemprop": "name"})
-                prediction_span = match.find("span", class_="forepr")
-                probs = match.find("div", class_="fprc")
-                link_tag = match.find("a", class_="tnmscn")
-                time_tag = match.find("span", class_="date_bah")
-                time_element = match.find("time", {"itemprop": "startDate"})
-                score_full = match.find("b", class_="l_scr")
-                score_half = match.find("span", class_="ht_scr")
-                et_min = match.find("div", class_="ladtm")
-                et_minute = match.find("span", class_="l_min")
-                live_odds_tag = match.find("span", class_="lscrsp")
-                
-                # Skip if essential elements are missing
-                if not all([meta, prediction_span, probs, link_tag]):
-                    logger.warning(f"Match #{i+1} skipped: Missing essential elements")
+                match_data = parse_listing_row(match, i)
+                if match_data is None:
                     continue
 
-                # Extract all data
-                game_name = meta.get("content", "").strip()
-                prediction = prediction_span.get_text(strip=True)
-                match_time = time_tag.text.strip() if time_tag else ""
-                match_datetime = time_element.get("datetime", "") if time_element else ""
-                match_score = score_full.text.strip() if score_full else ""
-                half_time_score = score_half.text.strip() if score_half else ""
-                extra_time = et_min.text.strip() if et_min else ""
-                extra_minute = et_minute.text.strip() if et_minute else ""
-                live_odds = live_odds_tag.text.strip() if live_odds_tag else ""
-
-                # Extract probabilities
-                prob_spans = probs.find_all("span")
-                if len(prob_spans) != 3:
-                    logger.warning(f"Match #{i+1} skipped: Incorrect probability format")
+                if match_data["url"] in journaled:
+                    predictions.append(journaled[match_data["url"]])
                     continue
-                    
-                prob_1, prob_x, prob_2 = [p.text.strip() for p in prob_spans]
 
-                # Extract teams and URL
-                home_team = link_tag.find("span", class_="homeTeam").text.strip()
-                away_team = link_tag.find("span", class_="awayTeam").text.strip()
-                raw_href = link_tag.get('href', '')
-                game_url = fix_forebet_url(raw_href)
-                
-                # Try to extract league name
-                league_tag = match.find_previous("center", class_="leagpredlnk")
-                league_name = ""
-                if league_tag:
-                    league_link = league_tag.find("a", class_="leagpred_btn")
-                    if league_link:
-                        league_name = league_link.get_text(strip=True)
-
-                # Store all basic data
-                match_data = {
-                    "base": {
-                        "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "game": game_name,
-                        "time_str": match_time,
-                        "iso_time": match_datetime,
-                        "score": match_score,
-                        "half_time_score": half_time_score,
-                        "et": extra_time,
-                        "et_minute": extra_minute,
-                        "prediction": prediction,
-                        "prob_1": prob_1,
-                        "prob_x": prob_x,
-                        "prob_2": prob_2,
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "match_url": game_url,
-                        "league": league_name,
-                        "live_odds": live_odds
-                    },
-                    "url": game_url,
-                    "home": home_team,
-                    "away": away_team
-                }
-                
                 temp_matches.append(match_data)
                 
             except Exception as e:
                 logger.error(f"Error processing match #{i+1}: {str(e)}")
-                traceback.print_exc()
+                # Tracebacks only at DEBUG: formatting them on the hot path is costly
+                logger.debug(f"Traceback for match #{i+1}", exc_info=True)
                 continue
 
         # Fetch detailed info for this batch using threads
         if temp_matches:
-            with ThreadPoolExecutor(max_workers=5) as executor:
+            # The controller bounds in-flight requests; the pool just needs enough threads
+            max_workers = controller.max_workers if controller else 5
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = {}
                 for m in temp_matches:
                     # Only fetch details if we have a valid URL
                     if m["url"] and m["url"].startswith("http"):
                         future = executor.submit(
-                            fetch_match_details, m["url"], m["home"], m["away"], scraper
+                            fetch_match_details, m["url"], m["home"], m["away"], scraper, controller
                         )
                         futures[future] = m
                 
                 # Process completed futures
+                batch_records = []
                 for future in as_completed(futures):
                     match = futures[future]
                     try:
                         result = future.result()
                         match["base"].update(result)
-                        predictions.append(match["base"])
-                        logger.info(f"Processed: {match['base']['game']}")
+                        batch_records.append(match["base"])
+                        logger.debug(f"Processed: {match['base']['game']}")
                     except Exception as e:
                         logger.error(f"Error in match detail processing: {e}")
                         # Add match with basic info only if details failed
-                        predictions.append(match["base"])
+                        batch_records.append(match["base"])
+
+            predictions.extend(batch_records)
+            if index:
+                index.update(current_date, batch_records)
+
+            # Journal the batch before saving so a crash mid-save can be replayed
+            if journal:
+                journal.record_results(current_date, batch_records)
+                journal.mark_batch(current_date, batch_start, batch_end)
+                journal.flush()
 
             # Save batch to database - only update existing records
-            save_to_mysql(predictions[-len(temp_matches):])
+            saved = save_records(batch_records)
+            if journal and saved:
+                journal.mark_saved(current_date, batch_records)
+            if history:
+                history.record(batch_records)
             logger.info(f"Processed {len(temp_matches)} matches in this batch")
             
     return predictions
 
-def save_to_mysql(data: List[Dict[str, str]]) -> Tuple[int, int]:
+def save_to_mysql(data: List[Dict[str, str]], raise_errors: bool = False) -> Tuple[int, int]:
     """
     Save the extracted data to MySQL database.
     Updates existing records and inserts new ones if they don't exist.
     
     Args:
         data: List of match data dictionaries
+        raise_errors: Re-raise database errors after rolling back instead of returning (0, 0)
     
     Returns:
         Tuple of (updated_count, inserted_count)
@@ -520,7 +1684,7 @@ def save_to_mysql(data: List[Dict[str, str]]) -> Tuple[int, int]:
     inserted_count = 0
     
     try:
-        conn = pymysql.connect(**MYSQL_CONFIG)
+        conn = get_db_connection()
         cursor = conn.cursor()
         
         # First check if record exists
@@ -637,7 +1801,7 @@ def save_to_mysql(data: List[Dict[str, str]]) -> Tuple[int, int]:
                 rows_affected = cursor.rowcount
                 if rows_affected > 0:
                     updated_count += 1
-                    logger.info(f"Updated: {match.get('home_team')} vs {match.get('away_team')}")
+                    logger.debug(f"Updated: {match.get('home_team')} vs {match.get('away_team')}")
             else:
                 # Record doesn't exist, insert new one
                 insert_values = (
@@ -679,7 +1843,7 @@ def save_to_mysql(data: List[Dict[str, str]]) -> Tuple[int, int]:
                 )
                 cursor.execute(insert_sql, insert_values)
                 inserted_count += 1
-                logger.info(f"Inserted new match: {match.get('home_team')} vs {match.get('away_team')}")
+                logger.debug(f"Inserted new match: {match.get('home_team')} vs {match.get('away_team')}")
         
         conn.commit()
         logger.info(f"Database summary: {updated_count} records updated, {inserted_count} records inserted")
@@ -688,23 +1852,47 @@ def save_to_mysql(data: List[Dict[str, str]]) -> Tuple[int, int]:
     except pymysql.MySQLError as e:
         logger.error(f"MySQL Error: {e}")
         if conn:
-            conn.rollback()
-        traceback.print_exc()
+            try:
+                conn.rollback()
+            except pymysql.MySQLError:
+                pass
+        # Drop the shared connection so the next save reconnects cleanly
+        close_db_connection()
+        logger.debug("Traceback for MySQL error", exc_info=True)
+        if raise_errors:
+            raise
         return (0, 0)
     except Exception as e:
         logger.error(f"Unexpected error during save: {e}")
         if conn:
             conn.rollback()
-        traceback.print_exc()
+        logger.debug("Traceback for save error", exc_info=True)
+        if raise_errors:
+            raise
         return (0, 0)
     finally:
         if cursor:
             cursor.close()
-        if conn:
-            conn.close()
+
+def save_records(data: List[Dict[str, str]]) -> bool:
+    """
+    Save records to MySQL and report whether the transaction committed.
+
+    The affected-row counts from save_to_mysql cannot be used for this:
+    an UPDATE that changes nothing counts zero rows, e.g. when replaying
+    records that already reached the database before a crash.
+    """
+    try:
+        save_to_mysql(data, raise_errors=True)
+        return True
+    except Exception:
+        # save_to_mysql has already logged the error
+        return False
 
 def save_to_excel(data: List[Dict[str, str]], filename: str = None):
     """Save extracted data to Excel file."""
+    import pandas as pd
+
     if not filename:
         date_str = datetime.datetime.now().strftime("%Y-%m-%d")
         filename = f"forebet_matches_{date_str}.xlsx"
@@ -715,17 +1903,39 @@ def save_to_excel(data: List[Dict[str, str]], filename: str = None):
         logger.info(f"Data saved to Excel file: {filename}")
         return True
     except Exception as e:
-        logger.error(f"Error saving to Excel: {e}")
-        traceback.print_exc()
+        logger.error(f"Error saving to Excel: {e}", exc_info=True)
         return False
 
-def fetch_multiple_dates(driver, days_ahead: int = 3) -> List[Dict[str, str]]:
+def create_scraper() -> cloudscraper.CloudScraper:
+    """Create the cloudscraper session used for match detail requests."""
+    import cloudscraper
+
+    return cloudscraper.create_scraper(
+        browser={
+            'browser': 'chrome',
+            'platform': 'windows',
+            'desktop': True
+        },
+        delay=10
+    )
+
+def fetch_multiple_dates(driver, days_ahead: int = 3,
+                         journal: Optional[CheckpointJournal] = None,
+                         scraper: Optional[cloudscraper.CloudScraper] = None,
+                         history: Optional[PredictionHistory] = None,
+                         index: Optional[MatchIndex] = None,
+                         controller: Optional[AdaptiveController] = None) -> List[Dict[str, str]]:
     """
     Fetch data for multiple dates: today and up to X days ahead.
     
     Args:
         driver: Selenium WebDriver instance
         days_ahead: Number of days to fetch after today
+        journal: Optional checkpoint journal; completed dates are skipped
+        scraper: Optional cloudscraper session to reuse; a new one is created if omitted
+        history: Optional prediction history store to record changes in
+        index: Optional in-memory match index served by the read API
+        controller: Optional adaptive concurrency controller for detail fetches
         
     Returns:
         Combined list of prediction data for all dates
@@ -733,43 +1943,465 @@ def fetch_multiple_dates(driver, days_ahead: int = 3) -> List[Dict[str, str]]:
     all_predictions = []
     dates = get_dates_range(days_ahead)
     logger.info(f"Fetching data for these dates: {dates}")
+
+    if index:
+        index.retain_dates(dates)
+
+    completed = set(journal.completed_dates()) if journal else set()
+    if completed:
+        logger.info(f"Skipping dates completed by a previous run: {sorted(completed)}")
     
     # Setup cloud scraper for additional requests
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'desktop': True
-        },
-        delay=10
-    )
+    if scraper is None:
+        scraper = create_scraper()
     
     # Process each date
     for date in dates:
+        if date in completed:
+            resumed = list(journal.completed_results(date).values())
+            if index:
+                index.update(date, resumed)
+            all_predictions.extend(resumed)
+            continue
+
         try:
             logger.info(f"Processing date: {date}")
             url = get_dynamic_url(date)
             html = load_full_page(driver, url)
-            predictions = parse_page(html, scraper, date)
+            predictions = parse_page(html, scraper, date, journal, history, index, controller)
             
             all_predictions.extend(predictions)
+            if journal:
+                journal.mark_date(date, len(predictions))
             logger.info(f"Completed fetching for date: {date}, found {len(predictions)} matches")
             
             # Random delay between date processing
             random_delay()
             
         except Exception as e:
-            logger.error(f"Error processing date {date}: {e}")
-            traceback.print_exc()
+            logger.error(f"Error processing date {date}: {e}", exc_info=True)
     
     return all_predictions
 
+def incomplete_dates(journal: CheckpointJournal, days_ahead: int) -> List[str]:
+    """Return the dates in the scrape range that the journal has not marked complete."""
+    return sorted(set(get_dates_range(days_ahead)) - set(journal.completed_dates()))
+
+def run_cycle(driver, scraper: cloudscraper.CloudScraper, journal: CheckpointJournal,
+              args: argparse.Namespace,
+              history: Optional[PredictionHistory] = None,
+              index: Optional[MatchIndex] = None,
+              controller: Optional[AdaptiveController] = None) -> List[Dict[str, str]]:
+    """
+    Run one full scrape: fetch all dates, compact the journal if every date
+    completed and export to Excel if requested.
+
+    Args:
+        driver: Selenium WebDriver instance
+        scraper: cloudscraper session for match detail requests
+        journal: Checkpoint journal for this run
+        args: Parsed command line arguments
+        history: Optional prediction history store
+        index: Optional in-memory match index served by the read API
+        controller: Optional adaptive concurrency controller for detail fetches
+
+    Returns:
+        Combined list of prediction data for all dates
+    """
+    predictions = fetch_multiple_dates(driver, days_ahead=args.days, journal=journal,
+                                       scraper=scraper, history=history, index=index,
+                                       controller=controller)
+
+    logger.info(f"Total predictions collected: {len(predictions)}")
+
+    # Keep the journal intact for --resume if any date failed (e.g. a Cloudflare block)
+    missing = incomplete_dates(journal, args.days)
+    if missing:
+        logger.warning(f"Not compacting checkpoint journal, incomplete dates: {sorted(missing)}")
+    else:
+        journal.compact()
+
+    # Save to Excel if requested
+    if args.excel and predictions:
+        excel_file = f"forebet_matches_{datetime.datetime.now().strftime('%Y-%m-%d')}.xlsx"
+        save_to_excel(predictions, excel_file)
+        logger.info(f"Data saved to {excel_file}")
+
+    return predictions
+
+def run_daemon(journal: CheckpointJournal, args: argparse.Namespace,
+               history: Optional[PredictionHistory] = None,
+               index: Optional[MatchIndex] = None,
+               controller: Optional[AdaptiveController] = None):
+    """
+    Run scrape cycles on a fixed schedule until SIGINT/SIGTERM.
+
+    The WebDriver, cloudscraper session and MySQL connection are kept warm
+    between cycles; the driver is only recreated after a cycle that raised
+    or left dates incomplete.
+    """
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, stopping after current cycle")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    interval = args.interval * 60
+    driver = None
+    scraper = create_scraper()
+    cycle = 0
+
+    try:
+        while not stop_event.is_set():
+            cycle += 1
+            started = time.monotonic()
+            logger.info(f"Starting daemon cycle {cycle}")
+
+            # The first cycle behaves like a one-shot run: replay and keep the
+            # journal only with --resume. Later cycles replay this daemon's own
+            # unsaved rows, then start fresh.
+            if cycle == 1 and args.resume:
+                replay_unsaved_results(journal, history)
+            else:
+                if cycle > 1:
+                    replay_unsaved_results(journal, history)
+                journal.reset()
+
+            try:
+                if driver is None:
+                    driver = setup_driver()
+                run_cycle(driver, scraper, journal, args, history, index, controller)
+                # Per-date errors are logged rather than raised, so a dead
+                # Chrome only shows up as dates left incomplete
+                failed = bool(incomplete_dates(journal, args.days))
+            except Exception as e:
+                logger.error(f"Error in daemon cycle {cycle}: {e}", exc_info=True)
+                failed = True
+
+            if failed:
+                # Recreate the driver next cycle in case Chrome died
+                try:
+                    if driver:
+                        driver.quit()
+                except Exception:
+                    pass
+                driver = None
+
+            elapsed = time.monotonic() - started
+            wait = max(0, interval - elapsed)
+            logger.info(f"Daemon cycle {cycle} finished in {elapsed:.1f}s, next cycle in {wait:.0f}s")
+            stop_event.wait(wait)
+    finally:
+        try:
+            if driver:
+                driver.quit()
+                logger.info("WebDriver closed")
+        except Exception:
+            pass
+
+def write_queued_results(queue: JobQueue, history: Optional[PredictionHistory] = None,
+                         index: Optional[MatchIndex] = None) -> int:
+    """
+    Save one batch of completed detail results from the job queue to MySQL.
+
+    If the batch fails while the database is reachable, its records are
+    saved one by one so a single bad record cannot hold back the others;
+    records that keep failing are marked failed after MAX_WRITE_ATTEMPTS.
+
+    Returns:
+        Number of results written
+    """
+    rows = queue.unwritten_results(WRITER_BATCH_SIZE)
+    if not rows:
+        return 0
+
+    if save_records([row["result"] for row in rows]):
+        saved = rows
+    else:
+        try:
+            get_db_connection()
+        except Exception as e:
+            # An outage is not the records' fault, so no write attempt is counted
+            logger.warning(f"Database unavailable, {len(rows)} queued results will be retried: {e}")
+            close_db_connection()
+            return 0
+
+        saved = []
+        failed_ids = []
+        for row in rows:
+            if save_records([row["result"]]):
+                saved.append(row)
+            else:
+                failed_ids.append(row["id"])
+        given_up = queue.mark_write_failed(failed_ids)
+        logger.warning(
+            f"Failed to write {len(failed_ids)} of {len(rows)} queued results "
+            f"({given_up} given up after {MAX_WRITE_ATTEMPTS} attempts)"
+        )
+        if not saved:
+            return 0
+
+    records = [row["result"] for row in saved]
+    queue.mark_written([row["id"] for row in saved])
+    if history:
+        history.record(records)
+    if index:
+        # One update per date, since each update invalidates the response cache
+        by_date = {}
+        for row in saved:
+            by_date.setdefault(row["date"], []).append(row["result"])
+        for date, date_records in by_date.items():
+            index.update(date, date_records)
+    return len(saved)
+
+def expand_listings(queue: JobQueue, worker_id: str, history: Optional[PredictionHistory] = None,
+                    index: Optional[MatchIndex] = None):
+    """Turn each leased listing job into detail jobs, writing finished results in between."""
+    driver = None
+    try:
+        while True:
+            job = queue.lease(worker_id, "listing", LISTING_LEASE_TIMEOUT)
+            if job is None:
+                break
+
+            date = job["payload"]["date"]
+            try:
+                if driver is None:
+                    driver = setup_driver()
+                html = load_full_page(driver, get_dynamic_url(date))
+                rows = [m for m in parse_listing(html) if m["url"] and m["url"].startswith("http")]
+                added = queue.enqueue_many("detail", date, [(m["url"], m) for m in rows])
+                queue.complete(job["id"], worker_id)
+                logger.info(f"Queued {added} detail jobs for {date} ({len(rows)} matches listed)")
+            except Exception as e:
+                logger.error(f"Error expanding listing for {date}: {e}")
+                queue.release(job["id"], worker_id)
+                try:
+                    if driver:
+                        driver.quit()
+                except Exception:
+                    pass
+                driver = None
+
+            # Write whatever the workers have finished so far
+            while write_queued_results(queue, history, index):
+                pass
+            random_delay()
+    finally:
+        try:
+            if driver:
+                driver.quit()
+                logger.info("WebDriver closed")
+        except Exception:
+            pass
+
+def run_coordinator(queue: JobQueue, args: argparse.Namespace,
+                    history: Optional[PredictionHistory] = None,
+                    index: Optional[MatchIndex] = None):
+    """
+    Expand the date range into detail jobs and act as the single batched DB writer.
+
+    Listing pages are loaded here with one WebDriver; each listing row becomes
+    a detail job for the workers. Completed results are written to MySQL in
+    batches until every detail job is done or has failed.
+    """
+    worker_id = f"coordinator-{socket.gethostname()}-{os.getpid()}"
+    if not args.resume:
+        queue.reset()
+
+    dates = get_dates_range(args.days)
+    queue.enqueue_many("listing", "", [(date, {"date": date}) for date in dates])
+    queue.start_run()
+    logger.info(f"Coordinator queued listing jobs for: {dates}")
+
+    try:
+        expand_listings(queue, worker_id, history, index)
+        queue.set_meta("expansion_done", "1")
+        logger.info("Coordinator finished expanding listings, writing results")
+
+        written_total = 0
+        last_status = time.time()
+        while True:
+            written = write_queued_results(queue, history, index)
+            written_total += written
+            if written:
+                continue
+            # Workers that died mid-job leave leases only lease() would otherwise reap
+            queue.reap_expired("detail")
+            if queue.drained() and not queue.unwritten_results(1):
+                break
+            if time.time() - last_status >= QUEUE_STATUS_INTERVAL:
+                counts = queue.counts("detail")
+                logger.info(
+                    f"Waiting for workers: {counts.get('pending', 0)} detail jobs pending, "
+                    f"{counts.get('leased', 0)} leased"
+                )
+                last_status = time.time()
+            time.sleep(QUEUE_POLL_INTERVAL)
+    finally:
+        queue.finish_run()
+
+    counts = queue.counts("detail")
+    logger.info(
+        f"Coordinator done: {written_total} results written, "
+        f"{counts.get('done', 0)} detail jobs done, {counts.get('failed', 0)} failed"
+    )
+
+def run_worker(queue: JobQueue, args: argparse.Namespace,
+               controller: Optional[AdaptiveController] = None):
+    """
+    Lease detail jobs from the queue and fetch match details until it drains.
+
+    Each worker process has its own cloudscraper session and adaptive
+    controller, so rate limits apply per worker (and per IP). Workers never
+    touch MySQL; results go back into the queue for the coordinator.
+    """
+    worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    scraper = create_scraper()
+    stop_event = threading.Event()
+
+    def request_stop(signum, frame):
+        logger.info(f"Received signal {signum}, finishing in-flight jobs")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    completed = [0]
+    completed_lock = threading.Lock()
+
+    def work_one() -> bool:
+        """Process one detail job; returns False once the run has drained or finished."""
+        job = queue.lease(worker_id, "detail", args.lease_timeout)
+        if job is None:
+            if not queue.run_active() or queue.drained():
+                return False
+            stop_event.wait(QUEUE_POLL_INTERVAL)
+            return True
+
+        match = job["payload"]
+        try:
+            result = fetch_match_details(match["url"], match["home"], match["away"], scraper, controller)
+            record = dict(match["base"])
+            record.update(result)
+            if not queue.complete(job["id"], worker_id, record):
+                logger.warning(f"Lease lost for {match['url']}, result discarded")
+                return True
+            with completed_lock:
+                completed[0] += 1
+                if completed[0] % 50 == 0:
+                    logger.info(f"Worker {worker_id} completed {completed[0]} jobs")
+        except Exception as e:
+            logger.error(f"Error in detail job for {match.get('url')}: {e}")
+            queue.release(job["id"], worker_id)
+        return True
+
+    def work_loop():
+        while not stop_event.is_set():
+            try:
+                if not work_one():
+                    return
+            except Exception as e:
+                # e.g. "database is locked" on the shared queue; a job leased
+                # by this thread is handed out again once its lease expires
+                logger.error(f"Job queue error in worker {worker_id}: {e}", exc_info=True)
+                stop_event.wait(QUEUE_POLL_INTERVAL)
+
+    # Queue state from a finished run must not make the worker exit at once
+    if not queue.run_active():
+        logger.info(f"Worker {worker_id} waiting for a coordinator run")
+        while not stop_event.is_set() and not queue.run_active():
+            stop_event.wait(QUEUE_POLL_INTERVAL)
+
+    threads = controller.max_workers if controller else 5
+    logger.info(f"Worker {worker_id} starting with {threads} threads")
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(work_loop) for _ in range(threads)]
+        for future in futures:
+            future.result()
+    logger.info(f"Worker {worker_id} finished: {completed[0]} jobs completed")
+
 def main():
     # Parse command line arguments 
     parser = argparse.ArgumentParser(description='Forebet Scraper')
     parser.add_argument('--days', type=int, default=3, help='Number of days ahead to scrape (including today)')
     parser.add_argument('--excel', action='store_true', help='Save results to Excel file')
+    parser.add_argument('--resume', action='store_true', help='Resume an interrupted run (checkpoint journal, or the job queue with --coordinator)')
+    parser.add_argument('--checkpoint-file', default=CHECKPOINT_FILE, help='Path to the checkpoint journal')
+    parser.add_argument('--daemon', action='store_true', help='Keep running and scrape on a fixed schedule')
+    parser.add_argument('--interval', type=float, default=DAEMON_INTERVAL, help='Minutes between daemon cycles')
+    parser.add_argument('--history-file', default=HISTORY_FILE, help='Path to the prediction history store')
+    parser.add_argument('--no-history', action='store_true', help='Do not record prediction history')
+    parser.add_argument('--trajectory', metavar='MATCH_URL', help='Print the probability trajectory of a match and exit')
+    parser.add_argument('--flips', type=float, metavar='HOURS', help='Print matches whose prediction flipped in the last N hours and exit')
+    parser.add_argument('--min-workers', type=int, default=ADAPTIVE_MIN_WORKERS, help='Floor for concurrent detail fetches')
+    parser.add_argument('--max-workers', type=int, default=ADAPTIVE_MAX_WORKERS, help='Ceiling for concurrent detail fetches')
+    parser.add_argument('--min-gap', type=float, default=ADAPTIVE_MIN_GAP, help='Floor for seconds between detail requests')
+    parser.add_argument('--max-gap', type=float, default=ADAPTIVE_MAX_GAP, help='Ceiling for seconds between detail requests')
+    parser.add_argument('--fixed-concurrency', action='store_true', help='Disable adaptive concurrency (5 workers, fixed random delays)')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], help='Logging level (per-match messages are DEBUG)')
+    parser.add_argument('--log-file', help=f'Path to the JSON log file, rotated by size; must differ per process (default: {LOG_FILE}, or {WORKER_LOG_FILE} for workers)')
+    parser.add_argument('--coordinator', action='store_true', help='Queue listing rows as jobs for workers and write their results to MySQL')
+    parser.add_argument('--worker', action='store_true', help='Fetch match details for jobs leased from the queue')
+    parser.add_argument('--queue-file', default=QUEUE_FILE, help='Path to the shared job queue')
+    parser.add_argument('--worker-id', help='Worker name used for leases (default: host-pid)')
+    parser.add_argument('--lease-timeout', type=float, default=LEASE_TIMEOUT, help='Seconds before a leased job is handed to another worker')
+    parser.add_argument('--serve', action='store_true', help='Serve the latest scrape over a local HTTP JSON API (with --daemon, or --coordinator until interrupted)')
+    parser.add_argument('--serve-host', default=READ_API_HOST, help='Interface for the read API')
+    parser.add_argument('--serve-port', type=int, default=READ_API_PORT, help='Port for the read API')
     args = parser.parse_args()
+
+    # A one-shot run would only ever expose a half-built index
+    if args.serve and not (args.daemon or args.coordinator):
+        parser.error("--serve requires --daemon or --coordinator")
+    # A floor of zero workers would make every acquire() wait forever
+    if args.min_workers < 1:
+        parser.error("--min-workers must be at least 1")
+    if args.min_workers > args.max_workers:
+        parser.error("--min-workers cannot exceed --max-workers")
+    if args.min_gap < 0 or args.max_gap < 0:
+        parser.error("--min-gap and --max-gap cannot be negative")
+    if args.min_gap > args.max_gap:
+        parser.error("--min-gap cannot exceed --max-gap")
+
+    if args.worker and not args.worker_id:
+        args.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    if not args.log_file:
+        args.log_file = WORKER_LOG_FILE.format(worker_id=args.worker_id) if args.worker else LOG_FILE
+
+    setup_logging(getattr(logging, args.log_level), args.log_file)
+
+    # History queries only read the local store
+    if args.trajectory or args.flips is not None:
+        history = PredictionHistory(args.history_file)
+        try:
+            if args.trajectory:
+                result = history.probability_trajectory(args.trajectory)
+            else:
+                result = history.prediction_flips(args.flips)
+            print(json.dumps(result, indent=2))
+        finally:
+            history.close()
+        return
+
+    controller = None
+    if not args.fixed_concurrency:
+        controller = AdaptiveController(
+            min_workers=args.min_workers, max_workers=args.max_workers,
+            min_gap=args.min_gap, max_gap=args.max_gap
+        )
+
+    # Workers only talk to the job queue and the site, never to MySQL
+    if args.worker:
+        queue = JobQueue(args.queue_file)
+        try:
+            run_worker(queue, args, controller)
+        finally:
+            queue.close()
+        return
     
     logger.info("Starting Forebet Scraper - will update existing records and insert new ones")
     
@@ -778,24 +2410,63 @@ def main():
         logger.error("Database connection failed. Exiting.")
         return
     
+    history = None if args.no_history else PredictionHistory(args.history_file)
+
+    index = None
+    server = None
+    if args.serve:
+        index = MatchIndex()
+        server = start_read_api(index, args.serve_host, args.serve_port)
+
+    if args.coordinator:
+        queue = JobQueue(args.queue_file)
+        try:
+            run_coordinator(queue, args, history, index)
+            # The index only becomes complete once the run drains
+            if server:
+                logger.info("Coordinator run finished, serving the read API until SIGINT/SIGTERM")
+                wait_for_stop_signal()
+        except Exception as e:
+            logger.error(f"Error in coordinator: {e}", exc_info=True)
+        finally:
+            queue.close()
+            if history:
+                history.close()
+            close_db_connection()
+            if server:
+                server.shutdown()
+        logger.info("Script execution completed")
+        return
+
+    journal = CheckpointJournal(args.checkpoint_file)
+
+    if args.daemon:
+        try:
+            run_daemon(journal, args, history, index, controller)
+        finally:
+            if server:
+                server.shutdown()
+            journal.close()
+            if history:
+                history.close()
+            close_db_connection()
+        logger.info("Daemon stopped")
+        return
+
+    if args.resume:
+        replay_unsaved_results(journal, history)
+    else:
+        journal.reset()
+
     # Setup web driver
     try:
         driver = setup_driver()
         
         # Fetch predictions for multiple dates
-        predictions = fetch_multiple_dates(driver, days_ahead=args.days)
-        
-        logger.info(f"Total predictions collected: {len(predictions)}")
-        
-        # Save to Excel if requested
-        if args.excel and predictions:
-            excel_file = f"forebet_matches_{datetime.datetime.now().strftime('%Y-%m-%d')}.xlsx"
-            save_to_excel(predictions, excel_file)
-            logger.info(f"Data saved to {excel_file}")
+        run_cycle(driver, create_scraper(), journal, args, history, index, controller)
         
     except Exception as e:
-        logger.error(f"Error in main process: {e}")
-        traceback.print_exc()
+        logger.error(f"Error in main process: {e}", exc_info=True)
     finally:
         # Ensure driver is closed
         try:
@@ -804,6 +2475,10 @@ def main():
                 logger.info("WebDriver closed")
         except:
             pass
+        journal.close()
+        if history:
+            history.close()
+        close_db_connection()
         
     logger.info("Script execution completed")
 if __name__ == "__main__":
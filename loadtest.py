@@ -0,0 +1,84 @@
+import argparse
+import http.client
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+
+def run_worker(url: str, deadline: float, use_etag: bool,
+               latencies: List[float], statuses: Dict[int, int], lock: threading.Lock):
+    """Issue requests over one keep-alive connection until the deadline."""
+    parsed = urlparse(url)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+
+    conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=10)
+    etag = None
+    local_latencies = []
+    local_statuses = {}
+
+    while time.perf_counter() < deadline:
+        headers = {"If-None-Match": etag} if use_etag and etag else {}
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=10)
+            local_statuses[0] = local_statuses.get(0, 0) + 1
+            continue
+        local_latencies.append(time.perf_counter() - start)
+        local_statuses[response.status] = local_statuses.get(response.status, 0) + 1
+        etag = response.getheader("ETag") or etag
+
+    conn.close()
+    with lock:
+        latencies.extend(local_latencies)
+        for status, count in local_statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile of already sorted values."""
+    if not values:
+        return 0.0
+    position = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[position]
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Forebet scraper read API')
+    parser.add_argument('--url', default='http://127.0.0.1:8080/matches', help='Endpoint to request')
+    parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent clients')
+    parser.add_argument('--duration', type=float, default=10, help='Test duration in seconds')
+    parser.add_argument('--etag', action='store_true', help='Poll with If-None-Match like a caching client')
+    args = parser.parse_args()
+
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    started = time.perf_counter()
+    deadline = started + args.duration
+
+    threads = [
+        threading.Thread(target=run_worker, args=(args.url, deadline, args.etag, latencies, statuses, lock))
+        for _ in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(f"URL:          {args.url}")
+    print(f"Concurrency:  {args.concurrency}")
+    print(f"Requests:     {len(latencies)} in {elapsed:.1f}s")
+    print(f"Requests/sec: {len(latencies) / elapsed:.1f}")
+    print(f"Latency p50:  {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"Latency p99:  {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"Statuses:     {dict(sorted(statuses.items()))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import http.client
+import http.server
+import threading
+import time
+
+import pytest
+
+import flash
+
+# Capacity of the stub server per phase, and how many requests each phase lasts
+PHASES = ((8, 150), (2, 100), (8, 150))
+
+class CapacityServer(http.server.ThreadingHTTPServer):
+    """Stub match page server that answers 429 once in-flight requests exceed its capacity."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), CapacityHandler)
+        self.capacity = PHASES[0][0]
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+class CapacityHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            over = server.in_flight > server.capacity
+        try:
+            time.sleep(0.03)
+            status, body = (429, b"slow down") if over else (200, b"<html></html>")
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+def test_controller_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        flash.AdaptiveController(min_workers=0)
+    with pytest.raises(ValueError):
+        flash.AdaptiveController(min_workers=4, max_workers=2)
+    with pytest.raises(ValueError):
+        flash.AdaptiveController(min_gap=-1)
+
+def test_controller_backs_off_and_recovers():
+    server = CapacityServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    controller = flash.AdaptiveController(
+        min_workers=1, max_workers=10, initial_workers=2,
+        min_gap=0.001, max_gap=0.2, initial_gap=0.01
+    )
+    boundaries = [sum(n for _, n in PHASES[:i + 1]) for i in range(len(PHASES))]
+    # (phase, status, workers, gap) after each completed request
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        while True:
+            started = controller.acquire()
+            conn.request("GET", "/match")
+            response = conn.getresponse()
+            response.read()
+            controller.release(started, response.status)
+            with outcomes_lock:
+                if len(outcomes) >= boundaries[-1]:
+                    break
+                phase = next(i for i, end in enumerate(boundaries) if len(outcomes) < end)
+                outcomes.append((phase, response.status, controller.workers, controller.gap))
+                if len(outcomes) in boundaries[:-1]:
+                    server.capacity = PHASES[phase + 1][0]
+        conn.close()
+
+    clients = [threading.Thread(target=client) for _ in range(controller.max_workers)]
+    try:
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    def phase(i):
+        return [outcome for outcome in outcomes if outcome[0] == i]
+
+    ramp_up, squeezed, recovered = phase(0), phase(1), phase(2)
+    assert max(workers for _, _, workers, _ in ramp_up) >= 6
+    assert any(status == 429 for _, status, _, _ in squeezed)
+    assert min(workers for _, _, workers, _ in squeezed) <= 2
+    assert max(gap for _, _, _, gap in squeezed) > min(gap for _, _, _, gap in ramp_up)
+    assert max(workers for _, _, workers, _ in recovered) >= 6
@@ -0,0 +1,41 @@
+import argparse
+import signal
+
+import flash
+
+class DeadDriver:
+    def __init__(self, created):
+        created.append(self)
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+def test_driver_is_recreated_after_incomplete_cycle(tmp_path, monkeypatch):
+    created = []
+    loads = []
+
+    def load_full_page(driver, url):
+        loads.append(url)
+        if len(loads) == 3:
+            signal.raise_signal(signal.SIGTERM)
+        raise RuntimeError("chrome not reachable")
+
+    monkeypatch.setattr(flash, "setup_driver", lambda: DeadDriver(created))
+    monkeypatch.setattr(flash, "create_scraper", lambda: None)
+    monkeypatch.setattr(flash, "load_full_page", load_full_page)
+    monkeypatch.setattr(flash, "replay_unsaved_results", lambda journal, history: None)
+
+    journal = flash.CheckpointJournal(str(tmp_path / "checkpoint.db"))
+    args = argparse.Namespace(days=0, interval=0, resume=False, excel=False)
+    previous = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    try:
+        flash.run_daemon(journal, args)
+    finally:
+        signal.signal(signal.SIGTERM, previous[0])
+        signal.signal(signal.SIGINT, previous[1])
+        journal.close()
+
+    assert len(loads) == 3
+    assert len(created) == 3
+    assert all(driver.closed for driver in created)
@@ -0,0 +1,143 @@
+import argparse
+import json
+import signal
+import sqlite3
+import threading
+
+import flash
+
+def make_queue(tmp_path, results=("m1", "m2", "m3")):
+    queue = flash.JobQueue(str(tmp_path / "jobs.db"))
+    queue.enqueue_many("detail", "2026-10-19", [(key, {"url": key}) for key in results])
+    return queue
+
+def complete_all(queue):
+    while True:
+        job = queue.lease("w1", "detail", 60)
+        if job is None:
+            return
+        queue.complete(job["id"], "w1", {"match_url": job["key"]})
+
+def status_of(queue, key):
+    return queue.conn.execute("SELECT status FROM jobs WHERE job_key = ?", (key,)).fetchone()[0]
+
+def test_expired_leases_are_reaped_then_failed(tmp_path):
+    queue = make_queue(tmp_path, results=("m1",))
+    for attempt in range(1, flash.MAX_JOB_ATTEMPTS + 1):
+        job = queue.lease("w1", "detail", -1)
+        assert job["attempts"] == attempt
+        assert queue.reap_expired("detail") == 1
+        expected = "failed" if attempt == flash.MAX_JOB_ATTEMPTS else "pending"
+        assert status_of(queue, "m1") == expected
+    assert queue.lease("w1", "detail", 60) is None
+    queue.close()
+
+def test_stale_run_state_does_not_look_drained(tmp_path):
+    queue = make_queue(tmp_path, results=())
+    queue.set_meta("expansion_done", "1")
+    queue.finish_run()
+    assert not queue.run_active()
+
+    queue.start_run()
+    assert queue.run_active()
+    assert not queue.drained()
+    queue.set_meta("expansion_done", "1")
+    assert queue.drained()
+    queue.close()
+
+def test_resumed_run_reclaims_listing_leases(tmp_path):
+    queue = make_queue(tmp_path, results=())
+    queue.enqueue_many("listing", "", [("2026-10-19", {}), ("2026-10-20", {})])
+    queue.start_run()
+    first = queue.lease("dead-coordinator", "listing", flash.LISTING_LEASE_TIMEOUT)
+    queue.complete(first["id"], "dead-coordinator")
+    queue.lease("dead-coordinator", "listing", flash.LISTING_LEASE_TIMEOUT)
+    queue.set_meta("expansion_done", "1")
+    assert not queue.drained()
+
+    queue.start_run()
+    job = queue.lease("coordinator", "listing", flash.LISTING_LEASE_TIMEOUT)
+    assert job["key"] == "2026-10-20"
+    queue.close()
+
+def test_bad_record_does_not_block_batch(tmp_path, monkeypatch):
+    queue = make_queue(tmp_path)
+    complete_all(queue)
+    monkeypatch.setattr(flash, "get_db_connection", lambda: None)
+    monkeypatch.setattr(flash, "save_records", lambda data: all(r["match_url"] != "m2" for r in data))
+    index = flash.MatchIndex()
+
+    assert flash.write_queued_results(queue, index=index) == 2
+    assert sorted(m["match_url"] for m in json.loads(index.query()[0])["matches"]) == ["m1", "m3"]
+    for _ in range(flash.MAX_WRITE_ATTEMPTS - 1):
+        assert status_of(queue, "m2") == "done"
+        assert flash.write_queued_results(queue) == 0
+    assert status_of(queue, "m2") == "failed"
+    assert queue.unwritten_results(10) == []
+    queue.close()
+
+def test_index_is_updated_once_per_date(tmp_path, monkeypatch):
+    queue = make_queue(tmp_path)
+    queue.enqueue_many("detail", "2026-10-20", [("m4", {"url": "m4"})])
+    complete_all(queue)
+    monkeypatch.setattr(flash, "save_records", lambda data: True)
+    index = flash.MatchIndex()
+
+    assert flash.write_queued_results(queue, index=index) == 4
+    assert index.version == 2
+    assert json.loads(index.query(date="2026-10-19")[0])["count"] == 3
+    queue.close()
+
+def test_database_outage_is_retried_without_counting_attempts(tmp_path, monkeypatch):
+    queue = make_queue(tmp_path)
+    complete_all(queue)
+
+    def unavailable():
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(flash, "get_db_connection", unavailable)
+    monkeypatch.setattr(flash, "save_records", lambda data: False)
+    for _ in range(flash.MAX_WRITE_ATTEMPTS + 1):
+        assert flash.write_queued_results(queue) == 0
+    assert len(queue.unwritten_results(10)) == 3
+
+    monkeypatch.setattr(flash, "save_records", lambda data: True)
+    assert flash.write_queued_results(queue) == 3
+    assert queue.unwritten_results(10) == []
+    queue.close()
+
+def test_worker_survives_queue_errors(tmp_path, monkeypatch):
+    queue = flash.JobQueue(str(tmp_path / "jobs.db"))
+    queue.start_run()
+    queue.enqueue_many("detail", "2026-10-19", [
+        ("m1", {"url": "m1", "home": "A", "away": "B", "base": {"match_url": "m1"}})
+    ])
+    queue.set_meta("expansion_done", "1")
+
+    lease = queue.lease
+    failures = []
+    lock = threading.Lock()
+
+    def flaky_lease(*args):
+        with lock:
+            if len(failures) < 5:
+                failures.append(1)
+                raise sqlite3.OperationalError("database is locked")
+        return lease(*args)
+
+    monkeypatch.setattr(queue, "lease", flaky_lease)
+    monkeypatch.setattr(flash, "QUEUE_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(flash, "create_scraper", lambda: None)
+    monkeypatch.setattr(flash, "fetch_match_details", lambda *args: {"league": "X"})
+
+    previous = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    try:
+        flash.run_worker(queue, argparse.Namespace(worker_id="w1", lease_timeout=60))
+    finally:
+        signal.signal(signal.SIGTERM, previous[0])
+        signal.signal(signal.SIGINT, previous[1])
+
+    assert len(failures) == 5
+    assert queue.counts("detail") == {"done": 1}
+    assert queue.unwritten_results(10)[0]["result"] == {"match_url": "m1", "league": "X"}
+    queue.close()
@@ -0,0 +1,47 @@
+import datetime
+
+import flash
+
+def make_record(match_url, hours_ago, prediction, prob_1="50", prob_x="30", prob_2="20"):
+    observed = datetime.datetime.now() - datetime.timedelta(hours=hours_ago)
+    return {
+        "match_url": match_url,
+        "timestamp": observed.strftime("%Y-%m-%d %H:%M:%S"),
+        "prediction": prediction,
+        "prob_1": prob_1,
+        "prob_x": prob_x,
+        "prob_2": prob_2,
+    }
+
+def test_only_changed_fields_are_recorded(tmp_path):
+    history = flash.PredictionHistory(str(tmp_path / "history.db"))
+    try:
+        assert history.record([make_record("u1", 3, "1")]) == len(flash.HISTORY_FIELDS)
+        assert history.record([make_record("u1", 2, "1")]) == 0
+        assert history.record([make_record("u1", 1, "X", prob_1="35", prob_x="40")]) == 3
+    finally:
+        history.close()
+
+def test_duplicate_match_in_one_batch_is_not_recorded_twice(tmp_path):
+    history = flash.PredictionHistory(str(tmp_path / "history.db"))
+    try:
+        written = history.record([make_record("u1", 2, "1"), make_record("u1", 1, "1")])
+        assert written == len(flash.HISTORY_FIELDS)
+        assert history.prediction_flips(24) == []
+    finally:
+        history.close()
+
+def test_trajectory_and_flips(tmp_path):
+    history = flash.PredictionHistory(str(tmp_path / "history.db"))
+    try:
+        history.record([make_record("u1", 5, "1")])
+        history.record([make_record("u1", 1, "X", prob_1="35", prob_x="40", prob_2="25")])
+
+        trajectory = history.probability_trajectory("u1")
+        assert [(p["prediction"], p["prob_1"]) for p in trajectory] == [("1", "50"), ("X", "35")]
+
+        flips = history.prediction_flips(2)
+        assert [(f["match_url"], f["previous"], f["prediction"]) for f in flips] == [("u1", "1", "X")]
+        assert history.prediction_flips(0.5) == []
+    finally:
+        history.close()
@@ -0,0 +1,99 @@
+import http.client
+import json
+import signal
+import threading
+
+import flash
+
+def make_record(n, league, home, away):
+    return {"match_url": f"https://example.com/m{n}", "league": league, "home_team": home, "away_team": away}
+
+def build_index():
+    index = flash.MatchIndex()
+    index.update("2026-10-19", [
+        make_record(1, "Premier League", "Arsenal", "Chelsea"),
+        make_record(2, "Premier League", "Everton", "Arsenal"),
+        make_record(3, "La Liga", "Sevilla", "Valencia"),
+    ])
+    index.update("2026-10-20", [make_record(4, "La Liga", "Arsenal", "Getafe")])
+    return index
+
+def urls(body):
+    return [m["match_url"][-2:] for m in json.loads(body)["matches"]]
+
+def test_query_filters_intersect():
+    index = build_index()
+    assert urls(index.query(team="arsenal")[0]) == ["m1", "m2", "m4"]
+    assert urls(index.query(date="2026-10-19", team="Arsenal")[0]) == ["m1", "m2"]
+    assert urls(index.query(league="la liga", date="2026-10-20")[0]) == ["m4"]
+    assert urls(index.query(league="Serie A")[0]) == []
+
+def test_update_replaces_record_and_changes_etag():
+    index = build_index()
+    _, etag = index.query(league="Premier League")
+    assert index.query(league="Premier League")[1] == etag
+
+    index.update("2026-10-19", [make_record(1, "FA Cup", "Arsenal", "Chelsea")])
+    body, new_etag = index.query(league="Premier League")
+    assert new_etag != etag
+    assert urls(body) == ["m2"]
+    assert urls(index.query(league="FA Cup")[0]) == ["m1"]
+
+def test_unrelated_update_keeps_etag():
+    index = build_index()
+    _, etag = index.query(league="La Liga")
+    _, other_etag = index.query(league="Premier League")
+    index.update("2026-10-19", [make_record(5, "Premier League", "Leeds", "Fulham")])
+    assert index.query(league="La Liga")[1] == etag
+    assert index.query(league="Premier League")[1] != other_etag
+
+def test_retain_dates_drops_stale_matches():
+    index = build_index()
+    index.retain_dates(["2026-10-20"])
+    assert urls(index.query()[0]) == ["m4"]
+    assert urls(index.query(team="Sevilla")[0]) == []
+
+def test_http_etag_returns_304_until_index_changes():
+    index = build_index()
+    server = flash.start_read_api(index, "127.0.0.1", 0)
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+
+        conn.request("GET", "/matches?team=Arsenal")
+        response = conn.getresponse()
+        body = response.read()
+        etag = response.getheader("ETag")
+        assert response.status == 200
+        assert urls(body) == ["m1", "m2", "m4"]
+
+        conn.request("GET", "/matches?team=Arsenal", headers={"If-None-Match": etag})
+        response = conn.getresponse()
+        assert response.read() == b""
+        assert response.status == 304
+
+        index.update("2026-10-20", [make_record(5, "La Liga", "Arsenal", "Betis")])
+        conn.request("GET", "/matches?team=Arsenal", headers={"If-None-Match": etag})
+        response = conn.getresponse()
+        body = response.read()
+        assert response.status == 200
+        assert urls(body) == ["m1", "m2", "m4", "m5"]
+
+        conn.request("GET", "/nope")
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 404
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_wait_for_stop_signal_returns_on_sigterm():
+    previous = signal.getsignal(signal.SIGTERM), signal.getsignal(signal.SIGINT)
+    timer = threading.Timer(0.1, signal.raise_signal, (signal.SIGTERM,))
+    timer.start()
+    try:
+        flash.wait_for_stop_signal()
+    finally:
+        timer.join()
+        signal.signal(signal.SIGTERM, previous[0])
+        signal.signal(signal.SIGINT, previous[1])